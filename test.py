@@ -15,15 +15,21 @@ int @global_increment(int value) {
     return value + MyType@y;
 };"""
 
-# Test the pattern
-matches = re.finditer(METHOD_PATTERN, sample_input)
-
-# Print the results
-for match in matches:
-    print("Full match:", match.group(0))
-    print("Comments:", match.group(1).strip())
-    print("Return type:", match.group(2))
-    print("Method name:", match.group(3))
-    print("Parameters:", match.group(4))
-    print("Method body:", match.group(5).strip())
-    print("---")
+
+def main():
+    # Test the pattern
+    matches = re.finditer(METHOD_PATTERN, sample_input)
+
+    # Print the results
+    for match in matches:
+        print("Full match:", match.group(0))
+        print("Comments:", match.group(1).strip())
+        print("Return type:", match.group(2))
+        print("Method name:", match.group(3))
+        print("Parameters:", match.group(4))
+        print("Method body:", match.group(5).strip())
+        print("---")
+
+
+if __name__ == "__main__":
+    main()